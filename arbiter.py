@@ -1,7 +1,7 @@
 
 import threading
 import chess
-import functools
+import queue
 import time
 
 
@@ -65,15 +65,18 @@ class Arbiter:
     def abort_game(self):
         self._game_stopped.set()
         with self._lock:
-            self.players[self.game_state.playing_team].cancel_turn_to_act(self)
+            playing_player = self.players[self.game_state.playing_team]
+        playing_player.cancel_turn_to_act(self)
 
     def select_act(self, act):
         if self._game_stopped.is_set():
             return
 
+        # Only the game state is updated while holding the lock. Watchers and players are called after releasing it, as
+        # they may block on other threads (the GUI waits for its UI thread) that in turn try to abort the game.
         with self._lock:
             if isinstance(act, chess.MoveAct):
-                is_legal_act = act.move in self.game_state.compute_legal_moves_for_playing_team()
+                is_legal_act = act.move in self.game_state.legal_moves_set()
             elif isinstance(act, chess.ClaimDrawAct):
                 is_legal_act = self.game_state.compute_result().may_claim_draw
             else:
@@ -81,32 +84,63 @@ class Arbiter:
 
             if is_legal_act:  # check that acts players try to perform are legal.
                 self.game_state = self.game_state.copy_with_act_applied(act)
-                self._notify_watchers()
 
-            time.sleep(0)
+            game_state = self.game_state
 
-            if not is_legal_act or not self.game_state.compute_result().is_finished:
-                self.players[self.game_state.playing_team].on_turn_to_act(self)
+        if is_legal_act:
+            self._notify_watchers()
+
+        # the game may have been aborted while the watchers were being notified, the next player must not act then
+        if self._game_stopped.is_set():
+            return
+
+        time.sleep(0)
+
+        if not is_legal_act or not game_state.compute_result().is_finished:
+            self.players[game_state.playing_team].on_turn_to_act(self)
 
 
 class AIChessPlayer(ChessPlayer):
     def __init__(self, ai_player):
         self.ai_player = ai_player
-        self.ai_waiting_thread = None
-
-    def _pick_act_in_separate_thread(self, arbiter):
-        # We pick the act in a separate thread, it will spend a lot of time waiting for separate processes to finish
-        # the computation. This way the GUI can remain responsive while the AI is thinking.
-        act = self.ai_player.pick_act(arbiter.game_state)
-        arbiter.select_act(act)
+        self._arbiters_to_act_for = queue.Queue()
+        self._worker_thread = None
+        self._worker_lock = threading.Lock()
+        # Seconds without a turn to act after which the worker thread exits. This is far longer than a turn of the
+        # opponent, human or AI, so the same worker serves the whole game; it only runs out after the game is over.
+        self.worker_idle_timeout = 60.0
+
+    def _pick_acts_in_separate_thread(self):
+        # We pick acts in a separate thread, it will spend a lot of time waiting for separate processes to finish
+        # the computation. This way the GUI can remain responsive while the AI is thinking. The thread is kept around
+        # for the following turns rather than started anew every turn, but exits once the player is no longer asked
+        # to act, so finished and aborted games do not leave threads behind.
+        while True:
+            try:
+                arbiter = self._arbiters_to_act_for.get(timeout=self.worker_idle_timeout)
+            except queue.Empty:
+                with self._worker_lock:
+                    if self._arbiters_to_act_for.empty():
+                        self._worker_thread = None
+                        return
+                continue
+
+            act = self.ai_player.pick_act(arbiter.game_state)
+            arbiter.select_act(act)
+            arbiter = act = None  # do not keep the game alive while waiting for the next turn
 
     def on_turn_to_act(self, arbiter):
-        target = functools.partial(self._pick_act_in_separate_thread, arbiter)
-        self.ai_waiting_thread = threading.Thread(group=None,
-                                                  target=target,
-                                                  name=None,
-                                                  daemon=True)
-        self.ai_waiting_thread.start()
+        with self._worker_lock:
+            self._arbiters_to_act_for.put(arbiter)
+
+            # the worker thread is gone if it has been idle, or if a computation failed, for example because it was
+            # aborted
+            if self._worker_thread is None or not self._worker_thread.is_alive():
+                self._worker_thread = threading.Thread(group=None,
+                                                       target=self._pick_acts_in_separate_thread,
+                                                       name=None,
+                                                       daemon=True)
+                self._worker_thread.start()
 
     def cancel_turn_to_act(self, arbiter):
         self.ai_player.abort_computation()
@@ -2,6 +2,9 @@ from enum import Enum
 from math import copysign
 
 
+POSITIONS = [(x, y) for x in range(0, 8) for y in range(0, 8)]
+
+
 class Move:
     """
     Move type that covers every kind of move in chess except for castling, including en passant.
@@ -13,6 +16,8 @@ class Move:
 
     Note that to_pos and captured_pos are the same for all capturing fmoves except en passant.
     """
+    __slots__ = ('from_pos', 'to_pos', 'moved_piece', 'captured_pos', 'captured_piece')
+
     def __init__(self,
                  from_pos,
                  to_pos,
@@ -25,24 +30,33 @@ class Move:
         self.captured_pos = captured_pos
         self.captured_piece = captured_piece
 
-    def compute_over_board_state(self, board_state):
-        new_board_state = board_state
+    def get_board_changes(self):
+        """
+        Gets the (position, piece) pairs this move writes to the board, in the order they are to be applied.
+        """
+        board_changes = []
         if self.captured_pos and self.captured_piece:
-            new_board_state = new_board_state\
-                .copy_with_piece_at(self.captured_pos, None)
-        new_board_state = new_board_state\
-            .copy_with_piece_at(self.from_pos, None)\
-            .copy_with_piece_at(self.to_pos, self.moved_piece)
-        return new_board_state
+            board_changes.append((self.captured_pos, None))
+        board_changes.append((self.from_pos, None))
+        board_changes.append((self.to_pos, self.moved_piece))
+        return board_changes
+
+    def compute_over_board_state(self, board_state):
+        return board_state.copy_with_pieces_at(self.get_board_changes())
+
+    def _key(self):
+        return self.from_pos, self.to_pos, self.moved_piece, self.captured_pos, self.captured_piece
 
     def __eq__(self, other):
-        return type(self) == type(other) and self.__dict__ == other.__dict__
+        return type(self) == type(other) and self._key() == other._key()
 
     def __hash__(self):
-        return hash(frozenset(self.__dict__.items()))
+        return hash(self._key())
 
 
 class PawnPromotionMove(Move):
+    __slots__ = ('promoted_piece',)
+
     def __init__(self, from_pos, to_pos, moved_piece,
                  promoted_piece,
                  captured_pos=None,
@@ -50,10 +64,11 @@ class PawnPromotionMove(Move):
         super().__init__(from_pos, to_pos, moved_piece, captured_pos, captured_piece)
         self.promoted_piece = promoted_piece
 
-    def compute_over_board_state(self, board_state):
-        return super(PawnPromotionMove, self)\
-            .compute_over_board_state(board_state)\
-            .copy_with_piece_at(self.to_pos, self.promoted_piece)
+    def _key(self):
+        return super()._key() + (self.promoted_piece,)
+
+    def get_board_changes(self):
+        return super(PawnPromotionMove, self).get_board_changes() + [(self.to_pos, self.promoted_piece)]
 
 
 class CastlingMove(Move):
@@ -61,12 +76,17 @@ class CastlingMove(Move):
     Castling move, represented by a separate class as the rules for rewriting the board are different than for regular
     moves.
     """
+    __slots__ = ('rook_pos', 'rook_piece')
+
     def __init__(self, from_pos, to_pos, moved_piece, rook_pos, rook_piece):
         super().__init__(from_pos, to_pos, moved_piece)
 
         self.rook_pos = rook_pos
         self.rook_piece = rook_piece
 
+    def _key(self):
+        return super()._key() + (self.rook_pos, self.rook_piece)
+
     @property
     def rook_to_pos(self):
         king_x, _ = self.to_pos
@@ -74,15 +94,17 @@ class CastlingMove(Move):
         new_rook_x = king_x + int(copysign(1, king_x - rook_prev_x))
         return (new_rook_x, rook_y)
 
-    def compute_over_board_state(self, board_state):
-        return board_state\
-            .copy_with_piece_at(self.from_pos, None)\
-            .copy_with_piece_at(self.to_pos, self.moved_piece)\
-            .copy_with_piece_at(self.rook_pos, None)\
-            .copy_with_piece_at(self.rook_to_pos, self.rook_piece)
+    def get_board_changes(self):
+        return [
+            (self.from_pos, None),
+            (self.to_pos, self.moved_piece),
+            (self.rook_pos, None),
+            (self.rook_to_pos, self.rook_piece)
+        ]
 
 
 class Piece:
+    __slots__ = ('team',)
     symbol = ' '
 
     def __init__(self, team):
@@ -114,6 +136,7 @@ class Piece:
 
 
 class Pawn(Piece):
+    __slots__ = ()
     symbol = 'P'
 
     def __init__(self, team):
@@ -186,6 +209,8 @@ class Pawn(Piece):
 
 
 class MoveToAttackedPositionsPiece(Piece):
+    __slots__ = ()
+
     def get_possible_moves(self, game_state, piece_position):
         piece = game_state.piece_at(piece_position)
         possible_moves = []
@@ -203,6 +228,7 @@ class SweepingPiece(MoveToAttackedPositionsPiece):
     """
     Common superclass for rooks, bishops and queens, which all make sweeping moves in a set of directions.
     """
+    __slots__ = ()
     sweep_directions = []
 
     def get_attacked_positions(self, game_state, piece_position):
@@ -220,6 +246,7 @@ class SweepingPiece(MoveToAttackedPositionsPiece):
 
 
 class Rook(SweepingPiece):
+    __slots__ = ()
     symbol = 'R'
     sweep_directions = [(1, 0), (-1, 0), (0, 1), (0, -1)]
 
@@ -228,6 +255,7 @@ class Rook(SweepingPiece):
 
 
 class Knight(MoveToAttackedPositionsPiece):
+    __slots__ = ()
     symbol = 'N'
 
     def __init__(self, team):
@@ -251,6 +279,7 @@ class Knight(MoveToAttackedPositionsPiece):
 
 
 class Bishop(SweepingPiece):
+    __slots__ = ()
     symbol = 'B'
     sweep_directions = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
 
@@ -259,6 +288,7 @@ class Bishop(SweepingPiece):
 
 
 class Queen(SweepingPiece):
+    __slots__ = ()
     symbol = 'Q'
     sweep_directions = Rook.sweep_directions + Bishop.sweep_directions
 
@@ -267,6 +297,7 @@ class Queen(SweepingPiece):
 
 
 class King(MoveToAttackedPositionsPiece):
+    __slots__ = ()
     symbol = 'K'
 
     def __init__(self, team):
@@ -343,6 +374,10 @@ def get_opponent_of(team):
     return "BW"["WB".index(team)]
 
 
+# names of the teams as shown to the players
+TEAM_NAMES = dict(W="White", B="Black")
+
+
 class Act:
     pass
 
@@ -423,7 +458,7 @@ class RepetitionRule(GameEndRule):
         while game_state_cursor:
             state = (frozenset(game_state_cursor.board_state.positions_and_pieces),
                      game_state_cursor.playing_team,
-                     frozenset(game_state_cursor.compute_legal_moves_for_playing_team()))
+                     game_state_cursor.legal_moves_set())
             try:
                 number_of_occurrences_by_state[state] += 1
             except KeyError:
@@ -600,8 +635,16 @@ class GameState:
         self.history_size = 0 if self.previous_state is None else 1 + self.previous_state.history_size
         self.playing_team = 'WB'[self.history_size % 2]
 
+        # Game states never change once created, so the expensive computations over them are done at most once. This
+        # matters for the rules that walk through the whole history of the game.
+        self._legal_moves = None
+        self._legal_moves_set = None
+        self._result = None
+
     def compute_result(self):
-        return GameResult(self)
+        if self._result is None:
+            self._result = GameResult(self)
+        return self._result
 
     def piece_at(self, pos):
         return self.board_state.piece_at(pos)
@@ -634,14 +677,24 @@ class GameState:
         return GameState(board_state, self, act)
 
     def compute_legal_moves_for_playing_team(self):
-        possible_moves = []
-        for pos, piece in self.board_state.positions_and_pieces:
-            if piece.team == self.playing_team:
-                for possible_move in piece.get_possible_moves(self, pos):
-                    outcome_of_move = self.copy_with_act_applied(MoveAct(possible_move, False))
-                    if not outcome_of_move.is_king_checked(self.playing_team):
-                        possible_moves.append(possible_move)
-        return possible_moves
+        if self._legal_moves is None:
+            possible_moves = []
+            for pos, piece in self.board_state.positions_and_pieces:
+                if piece.team == self.playing_team:
+                    for possible_move in piece.get_possible_moves(self, pos):
+                        outcome_of_move = self.copy_with_act_applied(MoveAct(possible_move, False))
+                        if not outcome_of_move.is_king_checked(self.playing_team):
+                            possible_moves.append(possible_move)
+            self._legal_moves = possible_moves
+        return list(self._legal_moves)
+
+    def legal_moves_set(self):
+        """
+        Gets the legal moves for the playing team as a frozenset, for cheap membership checks and comparisons.
+        """
+        if self._legal_moves_set is None:
+            self._legal_moves_set = frozenset(self.compute_legal_moves_for_playing_team())
+        return self._legal_moves_set
 
 
 class BoardState:
@@ -651,7 +704,7 @@ class BoardState:
 
     @staticmethod
     def empty():
-        return BoardState(dict([((x, y), None) for x in range(0, 8) for y in range(0, 8)]))
+        return BoardState(dict([(pos, None) for pos in POSITIONS]))
 
     @staticmethod
     def from_notation(notation):
@@ -685,15 +738,31 @@ class BoardState:
         """)
 
     def copy_with_piece_at(self, pos, piece):
-        assert pos in self.piece_by_pos, f"Coordinates are out of range: {pos}"
+        return self.copy_with_pieces_at([(pos, piece)])
+
+    def copy_with_pieces_at(self, board_changes):
+        """
+        Copies the board state once with all of the given (position, piece) pairs written to it, in order.
+        """
         new_piece_by_pos = dict(self.piece_by_pos)
-        new_piece_by_pos[pos] = piece
+        for pos, piece in board_changes:
+            assert pos in new_piece_by_pos, f"Coordinates are out of range: {pos}"
+            new_piece_by_pos[pos] = piece
         return BoardState(new_piece_by_pos)
 
     def piece_at(self, pos):
         assert pos in self.piece_by_pos, f"Coordinates are out of range: {pos}"
         return self.piece_by_pos[pos]
 
+    def changed_positions(self, other):
+        """
+        Gets the positions at which the piece differs from the other board state. Board states derived from each other
+        share their piece objects, so most unchanged squares are told apart by identity without comparing pieces.
+        """
+        other_piece_by_pos = other.piece_by_pos
+        return [pos for pos, piece in self.piece_by_pos.items()
+                if piece is not other_piece_by_pos[pos] and piece != other_piece_by_pos[pos]]
+
     def to_string(self, view_of_team):
         out = []
 
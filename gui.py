@@ -18,6 +18,57 @@ import time
 import arbiter
 
 
+# width and height of a board square in pixels, the size of the piece icons
+SQUARE_SIZE = 68
+
+# background color of each board square, in the order of chess.POSITIONS
+CHECKER_COLORS = ["orange" if (x + y) % 2 == 0 else "red" for x, y in chess.POSITIONS]
+
+# Index (ui_x * 8 + ui_y) of the UI grid cell showing each board square, in the order of chess.POSITIONS, when viewing
+# the board as either team. Either view mirrors a single axis, so the same list also maps grid cells back to squares.
+UI_GRID_INDEX_BY_SQUARE_INDEX = dict(W=[x * 8 + (7 - y) for x, y in chess.POSITIONS],
+                                     B=[(7 - x) * 8 + y for x, y in chess.POSITIONS])
+
+# pixel coordinates of the top left corner of each UI grid cell
+UI_GRID_CORNERS = [(ui_x * SQUARE_SIZE, ui_y * SQUARE_SIZE) for ui_x in range(0, 8) for ui_y in range(0, 8)]
+
+
+# PhotoImages by the file they were loaded from, shared by everything that displays them. They need a Tk root to exist,
+# so they are loaded on first use rather than at import time.
+_photo_image_by_filename = dict()
+
+
+def _load_photo_image(filename):
+    try:
+        return _photo_image_by_filename[filename]
+    except KeyError:
+        photo_image = tk.PhotoImage(file=filename)
+        _photo_image_by_filename[filename] = photo_image
+        return photo_image
+
+
+def _make_checker_image():
+    """
+    Draws the checker pattern of the whole board into a single image, as seen from white. Viewing the board from black
+    mirrors both axes, which leaves the pattern unchanged, so the image serves both views.
+    """
+    image = tk.PhotoImage(width=8 * SQUARE_SIZE, height=8 * SQUARE_SIZE)
+    for (x, y), color in zip(chess.POSITIONS, CHECKER_COLORS):
+        left, top = x * SQUARE_SIZE, (7 - y) * SQUARE_SIZE
+        image.put(color, to=(left, top, left + SQUARE_SIZE, top + SQUARE_SIZE))
+    return image
+
+
+def _load_piece_images():
+    """
+    Gets the piece icons, as a dict keyed by team followed by piece symbol, such as 'WP' for a white pawn.
+    """
+    piece_names = dict(P='pawn', R='rook', N='knight', B='bishop', Q='queen', K='king')
+    return dict((team + symbol, _load_photo_image("icons/" + name + "_" + team_name + ".png"))
+                for team, team_name in [('W', 'white'), ('B', 'black')]
+                for symbol, name in piece_names.items())
+
+
 class GUIGameWatcher(arbiter.GameWatcher):
     def __init__(self, gui, players_to_follow) -> None:
         self.gui = gui
@@ -27,61 +78,87 @@ class GUIGameWatcher(arbiter.GameWatcher):
 
     def on_game_state_changed(self, arbiter):
         game_state = arbiter.game_state
+        displayed = threading.Event()
 
-        def ui_task():
-            if game_state.playing_team in self.players_to_follow:
-                self.gui.view.set_to_view_of_team(game_state.playing_team)
-            else:
-                self.gui.view.set_to_view_of_team(self.players_to_follow[0])
+        def display_game_state():
+            self.last_update_timestamp = time.monotonic()
 
-            self.gui.view.game_state = game_state
+            if self.gui.arbiter is arbiter:  # if game has not been canceled
+                if game_state.playing_team in self.players_to_follow:
+                    self.gui.view.set_to_view_of_team(game_state.playing_team)
+                else:
+                    self.gui.view.set_to_view_of_team(self.players_to_follow[0])
 
-            if self.gui.game_status_frame:  # if game has not been canceled
+                self.gui.view.game_state = game_state
                 self.gui.game_status_frame.update_to_game_state(game_state)
 
-        self.gui.run_on_ui_thread(ui_task)
+            displayed.set()
 
-        # wait on this thread to allow the GUI thread to catch up (GUI updates are quite slow.)
-        timestamp = time.monotonic()
-        time_since_last_update = self.last_update_timestamp and (timestamp - self.last_update_timestamp) or self.min_time_since_last_update
-        self.last_update_timestamp = timestamp
-        time.sleep(max(0, self.min_time_since_last_update - time_since_last_update))
+        def ui_task():
+            # Game states are shown at most once every min_time_since_last_update, so that the moves can be followed.
+            # The delay is left to Tk, which keeps handling other events in the meantime.
+            if self.last_update_timestamp is not None:
+                delay = self.last_update_timestamp + self.min_time_since_last_update - time.monotonic()
+                if delay > 0:
+                    self.gui.after(int(delay * 1000), display_game_state)
+                    return
+            display_game_state()
+
+        self.gui.run_on_ui_thread(ui_task)
 
         # this ensures we do not overload the UI thread, which will end up never returning until game is finished.
-        with self.gui.ui_thread_done:
-            self.gui.ui_thread_done.wait()
+        displayed.wait()
 
 
 class GUIHumanChessPlayer(arbiter.ChessPlayer):
     def __init__(self, gui):
         self.gui = gui
         self.offer_draw = False
+        self.arbiter = None
 
-    def _move_selection_handler(self, arbiter, move):
-        self.cancel_turn_to_act(arbiter)
-        arbiter.select_act(chess.MoveAct(move, self.offer_draw))
+    def _select_act(self, act):
+        # The handlers are invoked on the UI thread, so the board is disabled right away; a second click must not
+        # select another act before the turn is canceled.
+        self.gui.view.allow_move_selection = False
+        self.gui.clear_handlers()
+
+        # The arbiter must not block the UI thread: the game watcher waits for the UI thread to display the new game
+        # state. The thread is a daemon so that it does not keep the program alive when the window is closed.
+        thread = threading.Thread(group=None,
+                                  target=functools.partial(self.arbiter.select_act, act),
+                                  name=None,
+                                  daemon=True)
+        thread.start()
+
+    def _move_selection_handler(self, move):
+        self.cancel_turn_to_act(self.arbiter)
+        self._select_act(chess.MoveAct(move, self.offer_draw))
 
     def _set_offer_draw_handler(self, offer_draw):
         self.offer_draw = offer_draw
 
-    def _claim_draw_handler(self, arbiter):
-        arbiter.select_act(chess.ClaimDrawAct())
-        self.cancel_turn_to_act(arbiter)
+    def _claim_draw_handler(self):
+        self._select_act(chess.ClaimDrawAct())
+        self.cancel_turn_to_act(self.arbiter)
 
-    def _surrender_handler(self, arbiter):
-        arbiter.select_act(chess.SurrenderAct())
-        self.cancel_turn_to_act(arbiter)
+    def _surrender_handler(self):
+        self._select_act(chess.SurrenderAct())
+        self.cancel_turn_to_act(self.arbiter)
 
     def on_turn_to_act(self, arbiter):
+        # the handlers are plain bound methods working on the arbiter of the current turn
+        self.arbiter = arbiter
+
         def ui_task():
             self.gui.view.allow_move_selection = True
-            self.gui.view.move_selection_handler = functools.partial(self._move_selection_handler, arbiter)
+            self.gui.view.move_selection_handler = self._move_selection_handler
 
             self.offer_draw = False
             self.gui.set_offer_draw_handler = self._set_offer_draw_handler
-            self.gui.claim_draw_handler = functools.partial(self._claim_draw_handler, arbiter)
-            self.gui.surrender_handler = functools.partial(self._surrender_handler, arbiter)
-            self.gui.game_status_frame.set_act_buttons_active(True)
+            self.gui.claim_draw_handler = self._claim_draw_handler
+            self.gui.surrender_handler = self._surrender_handler
+            if self.gui.game_status_frame:  # if game has not been canceled
+                self.gui.game_status_frame.set_act_buttons_active(True)
         self.gui.run_on_ui_thread(ui_task)
 
     def cancel_turn_to_act(self, arbiter):
@@ -89,38 +166,54 @@ class GUIHumanChessPlayer(arbiter.ChessPlayer):
             self.gui.view.allow_move_selection = False
             self.gui.view.reset_move_selection()
             self.gui.clear_handlers()
-            self.gui.game_status_frame.set_act_buttons_active(False)
+            if self.gui.game_status_frame:  # if game has not been canceled
+                self.gui.game_status_frame.set_act_buttons_active(False)
         self.gui.run_on_ui_thread(ui_task)
 
 
 class ChessBoardView(tk.Frame):
     class Square:
-        def __init__(self, button):
-            self.button = button
-            self.bg_color = None
+        def __init__(self, image_item):
+            self.image_item = image_item
             self.piece_team_and_symbol = None
 
     def __init__(self, parent, gui):
         super(ChessBoardView, self).__init__(parent)
         self.gui = gui
 
-        self._chess_square_by_ui_grid_pos = dict()
-        self._chess_square_by_pos = dict()
-
-        for x in range(0, 8):
-            for y in range(0, 8):
-                button = tk.Button(self, image=self.gui.empty_image, borderwidth=0)
-                button.grid(column=x, row=y, padx=0, pady=0)
-                self._chess_square_by_ui_grid_pos[(x, y)] = self.Square(button=button)
+        # The board is drawn on a single canvas: one image holding the checker pattern, and a piece image item per
+        # square on top of it. Possible moves are shown by rectangles that only exist while a piece is selected. This
+        # is a lot cheaper to update than a grid of 64 buttons.
+        self.canvas = tk.Canvas(self, width=8 * SQUARE_SIZE, height=8 * SQUARE_SIZE, borderwidth=0,
+                                highlightthickness=0)
+        self.canvas.pack()
+        self.canvas.bind('<Button-1>', self._on_canvas_click)
+        self._checker_image = _make_checker_image()
+        self._checker_item = self.canvas.create_image(0, 0, anchor='nw', image=self._checker_image)
+
+        # Every board position owns its canvas items for the lifetime of the view; flipping the view only moves them.
+        # Squares and UI grid cells are kept in flat lists of 64, indexed by x * 8 + y like chess.POSITIONS. The same
+        # integer square index is used as the key for the move selection state, positions are only looked up in
+        # chess.POSITIONS when talking to the game state.
+        self._chess_squares = []
+        self._square_index_by_ui_grid_index = None
+        self._ui_grid_index_by_square_index = None
+
+        for pos in chess.POSITIONS:
+            image_item = self.canvas.create_image(0, 0, anchor='nw', image=self.gui.empty_image)
+            self._chess_squares.append(self.Square(image_item=image_item))
 
         self.allow_move_selection = False
         self.move_selection_handler = None
         self._game_state = None
+        self._legal_moves_by_from_pos = None  # built on the first piece selection of a turn
+        self._displayed_board_state = None
+        self._redraw_pending = False
+        self._highlight_item_by_square_index = dict()
         self._view_of_team = None
 
         self.set_to_view_of_team('W')
-        self._possible_moves_by_to_pos = dict()
-        self._reset_square_colors()
+        self._possible_moves_by_to_index = dict()
 
     @property
     def game_state(self):
@@ -128,7 +221,18 @@ class ChessBoardView(tk.Frame):
 
     @game_state.setter
     def game_state(self, game_state):
+        if game_state is self._game_state:
+            return
         self._game_state = game_state
+        self._legal_moves_by_from_pos = None
+
+        # redraw once Tk is idle, so several game states assigned in a row only cause one redraw
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._flush_redraw)
+
+    def _flush_redraw(self):
+        self._redraw_pending = False
         self._update_chess_piece_images()
 
     class PawnPromotionDialog(tk.Toplevel):
@@ -149,8 +253,8 @@ class ChessBoardView(tk.Frame):
 
             for i in range(0, len(moves_to_choose)):
                 move = moves_to_choose[i]
-                button = tk.Button(self, image=gui.piece_images_by_team_and_symbol
-                [move.promoted_piece.team][move.promoted_piece.symbol], command=functools.partial(self.choose, move))
+                button = tk.Button(self, image=gui.piece_images[move.promoted_piece.team + move.promoted_piece.symbol],
+                                   command=functools.partial(self.choose, move))
                 button.pack(side='right')
 
             tk.Button(self, text='Cancel', command=self.cancel).pack(side='right')
@@ -164,15 +268,19 @@ class ChessBoardView(tk.Frame):
             self.parent.focus_set()
             self.destroy()
 
-    def _on_board_square_click(self, x, y):
+    def _on_canvas_click(self, event):
+        ui_x = int(self.canvas.canvasx(event.x)) // SQUARE_SIZE
+        ui_y = int(self.canvas.canvasy(event.y)) // SQUARE_SIZE
+        if ui_x in range(0, 8) and ui_y in range(0, 8):
+            self._on_board_square_click(self._square_index_by_ui_grid_index[ui_x * 8 + ui_y])
+
+    def _on_board_square_click(self, index):
         if not self.allow_move_selection or self.game_state is None:
             return
 
-        pos = (x, y)
-
-        try:
-            moves_to_clicked_position = self._possible_moves_by_to_pos[pos]
+        moves_to_clicked_position = self._possible_moves_by_to_index.get(index)
 
+        if moves_to_clicked_position is not None:
             if len(moves_to_clicked_position) > 1:
                 self.PawnPromotionDialog(self, self.gui, moves_to_clicked_position)
             else:
@@ -180,7 +288,8 @@ class ChessBoardView(tk.Frame):
 
                 if self.move_selection_handler is not None:
                     self.move_selection_handler(move)
-        except KeyError:
+        else:
+            pos = chess.POSITIONS[index]
             piece = self.game_state.piece_at(pos)
 
             if piece is not None and piece.team == self.game_state.playing_team:
@@ -188,65 +297,79 @@ class ChessBoardView(tk.Frame):
             else:
                 self.reset_move_selection()
 
-    def _set_square_color(self, pos, bg_color):
-        square = self._chess_square_by_pos[pos]
-        if square.bg_color != bg_color:
-            square.button['background'] = bg_color
-            square.button['activebackground'] = bg_color
+    def _ui_grid_square_coords(self, index):
+        left, top = UI_GRID_CORNERS[self._ui_grid_index_by_square_index[index]]
+        return left, top, left + SQUARE_SIZE, top + SQUARE_SIZE
 
-    def _reset_square_colors(self):
-        for x in range(0, 8):
-            for y in range(0, 8):
-                self._set_square_color((x, y), "orange" if (x + y) % 2 == 0 else "red")
+    def _highlight_square(self, index):
+        if index not in self._highlight_item_by_square_index:
+            highlight_item = self.canvas.create_rectangle(*self._ui_grid_square_coords(index), width=0, fill="blue")
+            self.canvas.tag_raise(highlight_item, self._checker_item)  # above the checker pattern, below the pieces
+            self._highlight_item_by_square_index[index] = highlight_item
 
     def reset_move_selection(self):
-        self._possible_moves_by_to_pos.clear()
-        self._reset_square_colors()
+        self._possible_moves_by_to_index.clear()
+
+        if self._highlight_item_by_square_index:
+            self.canvas.delete(*self._highlight_item_by_square_index.values())
+            self._highlight_item_by_square_index.clear()
 
     def set_to_view_of_team(self, view_of_team):
         if self._view_of_team == view_of_team:
             return
         self._view_of_team = view_of_team
 
-        for x in range(0, 8):
-            for y in range(0, 8):
-                square = self._chess_square_by_ui_grid_pos[(x, y)]
-                board_pos = (7 - x if view_of_team == 'B' else x, 7 - y if view_of_team == 'W' else y)
-                self._chess_square_by_pos[board_pos] = square
-                square.button['command'] = functools.partial(self._on_board_square_click, board_pos[0], board_pos[1])
-        self._reset_square_colors()
-        self._update_chess_piece_images()
+        # The squares keep their pieces, the canvas items are just moved to their new place on screen. The checker
+        # pattern looks the same from both sides and stays where it is.
+        self._ui_grid_index_by_square_index = UI_GRID_INDEX_BY_SQUARE_INDEX[view_of_team]
+        self._square_index_by_ui_grid_index = UI_GRID_INDEX_BY_SQUARE_INDEX[view_of_team]
 
-    def _update_chess_piece_images(self):
-        for x in range(0, 8):
-            for y in range(0, 8):
-                pos = (x, y)
-                square = self._chess_square_by_pos[pos]
-                piece = self.game_state and self.game_state.piece_at(pos)
-                team_and_symbol = piece and piece.team + piece.symbol
+        coords = self.canvas.coords
+        for square, ui_grid_index in zip(self._chess_squares, self._ui_grid_index_by_square_index):
+            coords(square.image_item, *UI_GRID_CORNERS[ui_grid_index])
 
-                if square.piece_team_and_symbol != team_and_symbol:
-                    square.piece_team_and_symbol = team_and_symbol
-                    piece_image = self.gui.piece_images_by_team_and_symbol[piece.team][piece.symbol] \
-                        if piece is not None else self.gui.empty_image
-                    square.button['image'] = piece_image
+        for index, highlight_item in self._highlight_item_by_square_index.items():
+            coords(highlight_item, *self._ui_grid_square_coords(index))
 
-        self.pack()
+    def _update_chess_piece_images(self):
+        board_state = self.game_state and self.game_state.board_state
+
+        # only visit the squares that changed since the last redraw, typically two to four of them after a move
+        if board_state is not None and self._displayed_board_state is not None:
+            changed_positions = board_state.changed_positions(self._displayed_board_state)
+        else:
+            changed_positions = chess.POSITIONS
+        self._displayed_board_state = board_state
+
+        piece_by_pos = board_state.piece_by_pos if board_state is not None else dict.fromkeys(chess.POSITIONS)
+        piece_images = self.gui.piece_images
+        empty_image = self.gui.empty_image
+        chess_squares = self._chess_squares
+        itemconfigure = self.canvas.itemconfigure
+
+        for pos in changed_positions:
+            x, y = pos
+            square = chess_squares[x * 8 + y]
+            piece = piece_by_pos[pos]
+            team_and_symbol = piece and piece.team + piece.symbol
+
+            if square.piece_team_and_symbol != team_and_symbol:
+                square.piece_team_and_symbol = team_and_symbol
+                itemconfigure(square.image_item, image=piece_images.get(team_and_symbol, empty_image))
 
     def _show_possible_moves_for_piece(self, pos):
         self.reset_move_selection()
 
-        all_possible_moves = self.game_state.compute_legal_moves_for_playing_team()
+        if self._legal_moves_by_from_pos is None:
+            self._legal_moves_by_from_pos = dict()
+            for move in self.game_state.compute_legal_moves_for_playing_team():
+                self._legal_moves_by_from_pos.setdefault(move.from_pos, []).append(move)
 
-        for move in all_possible_moves:
-            if move.from_pos == pos:
-                try:
-                    moves_by_to_pos = self._possible_moves_by_to_pos[move.to_pos]
-                    moves_by_to_pos.append(move)
-                except KeyError:
-                    moves_by_to_pos = [move]
-                    self._possible_moves_by_to_pos[move.to_pos] = moves_by_to_pos
-                self._set_square_color(move.to_pos, "blue")
+        for move in self._legal_moves_by_from_pos.get(pos, []):
+            to_x, to_y = move.to_pos
+            to_index = to_x * 8 + to_y
+            self._possible_moves_by_to_index.setdefault(to_index, []).append(move)
+            self._highlight_square(to_index)
 
 
 class ChessBoardGui(tk.Frame):
@@ -260,17 +383,18 @@ class ChessBoardGui(tk.Frame):
                 ("Stupid AI", lambda: arbiter.AIChessPlayer(ai.PawnsAndQueensAIPlayer())),
             ]
 
-            player_selection = dict(W=players[0][1](), B=players[0][1]())
+            # the players are only created when the game is started, not every time the selection changes
+            player_selection = dict(W=0, B=0)
 
             for team in 'WB':
                 var = tk.IntVar(self, 0, team + "_player")
 
                 def player_selection_change(team, var):
-                    player_selection[team] = players[var.get()][1]()
+                    player_selection[team] = var.get()
 
                 tk.Label(self,
-                         text=dict(W='White', B='Black')[team],
-                         font=tkinter.font.Font(family='Arial', size=12, weight=tkinter.font.BOLD)).pack(anchor='w', padx=6)
+                         text=chess.TEAM_NAMES[team],
+                         font=gui.bold_font).pack(anchor='w', padx=6)
 
                 buttons = [tk.Radiobutton(self,
                                           text=players[i][0],
@@ -282,11 +406,17 @@ class ChessBoardGui(tk.Frame):
 
             start_game_button = tk.Button(self,
                                           text='Start game!',
-                                          command=lambda: gui.start_game(dict(player_selection)))
+                                          command=lambda: gui.start_game(
+                                              dict((team, players[i][1]()) for team, i in player_selection.items())))
             start_game_button.pack()
 
     class GameActButtonsFrame(tk.Frame):
-        def __init__(self, parent, gui, game_state):
+        """
+        Buttons for the acts other than moves. Created once per game and refreshed at the start of every human turn;
+        the handlers are looked up on the gui when clicked, as they change from turn to turn.
+        """
+
+        def __init__(self, parent, gui):
             super().__init__(parent)
 
             self.gui = gui
@@ -296,15 +426,20 @@ class ChessBoardGui(tk.Frame):
                                              command=lambda: self.gui.set_offer_draw_handler(
                                                  self.offer_draw_var.get() and True or False))
 
-            self.surrender_button = tk.Button(self, text="Surrender", command=self.gui.surrender_handler)
+            self.surrender_button = tk.Button(self, text="Surrender", command=lambda: self.gui.surrender_handler())
             self.surrender_button.pack(side='right')
-            self.claim_draw_button = tk.Button(self, text="Claim draw", command=self.gui.claim_draw_handler)
+            self.claim_draw_button = tk.Button(self, text="Claim draw", command=lambda: self.gui.claim_draw_handler())
+
+        def refresh(self, game_state):
+            self.offer_draw_var.set(0)
 
             result = game_state.compute_result()
             if result.may_claim_draw:
                 self.claim_draw_button['text'] = "Claim draw by " + result.may_claim_draw_by_rule.describe(game_state)
+                self.offer_draw.pack_forget()
                 self.claim_draw_button.pack(side='right')
             else:
+                self.claim_draw_button.pack_forget()
                 self.offer_draw.pack(side='right')
 
     class GameStatusFrame(tk.Frame):
@@ -317,11 +452,11 @@ class ChessBoardGui(tk.Frame):
                                                 command=self.gui.abort_game)
             self._abort_game_button.pack(side='left', anchor='w', padx=25, pady=10)
 
-            self.status_label = tk.Label(self, text='', font=tkinter.font.Font(family='Arial', size=12,
-                                                                               weight=tkinter.font.BOLD))
+            self.status_label = tk.Label(self, text='', font=self.gui.bold_font)
             self.status_label.pack(side='right', anchor='w', padx=5)
 
-            self.act_buttons = None
+            self.act_buttons = self.gui.GameActButtonsFrame(self, self.gui)
+            self._act_buttons_active = False
             self.game_state = None
 
             # self.material_display = [None, None]
@@ -333,23 +468,25 @@ class ChessBoardGui(tk.Frame):
             # self._scaled_image_cache = dict()
             # for t in 'WB':
             #     scaled = dict()
-            #     for symbol in self.gui.piece_images_by_team_and_symbol[t]:
-            #         original_image = self.gui.piece_images_by_team_and_symbol[t][symbol]
+            #     for symbol in 'PRNBQK':
+            #         original_image = self.gui.piece_images[t + symbol]
             #         scaled[symbol] = original_image.subsample(4)
             #     self._scaled_image_cache[t] = scaled
 
         def set_act_buttons_active(self, act_buttons_active):
-            if (self.act_buttons is None) != act_buttons_active:
+            if self._act_buttons_active == act_buttons_active:
                 return
+            self._act_buttons_active = act_buttons_active
 
             if not act_buttons_active:
-                self.act_buttons.destroy()
-                self.act_buttons = None
+                self.act_buttons.pack_forget()
             else:
-                self.act_buttons = self.gui.GameActButtonsFrame(self, self.gui, self.game_state)
+                self.act_buttons.refresh(self.game_state)
                 self.act_buttons.pack(side='right')
 
         def update_to_game_state(self, game_state):
+            if game_state is self.game_state:
+                return
             self.game_state = game_state
 
             result = game_state.compute_result()
@@ -358,7 +495,7 @@ class ChessBoardGui(tk.Frame):
                 status_text = result.outcome.describe() + " by " + result.ended_by_rule.describe(game_state)
                 self._abort_game_button['text'] = "Close game"
             else:
-                status_text = dict(W="White", B="Black")[game_state.playing_team] + " moves"
+                status_text = chess.TEAM_NAMES[game_state.playing_team] + " moves"
             self.status_label['text'] = status_text
 
             # for i, team in [(0, 'W'), (1, 'B')]:
@@ -379,25 +516,11 @@ class ChessBoardGui(tk.Frame):
         # Note that Tkinter PhotoImage's are garbage collected even if they are needed for active widgets, it is
         # mandatory to keep a reference to them for the lifetime of the widget.
 
-        self.empty_image = tk.PhotoImage(file="icons/empty.png")
-        self.piece_images_by_team_and_symbol = dict(
-            W=dict(
-                P=tk.PhotoImage(file="icons/pawn_white.png"),
-                R=tk.PhotoImage(file="icons/rook_white.png"),
-                N=tk.PhotoImage(file="icons/knight_white.png"),
-                B=tk.PhotoImage(file="icons/bishop_white.png"),
-                Q=tk.PhotoImage(file="icons/queen_white.png"),
-                K=tk.PhotoImage(file="icons/king_white.png")
-            ),
-            B=dict(
-                P=tk.PhotoImage(file="icons/pawn_black.png"),
-                R=tk.PhotoImage(file="icons/rook_black.png"),
-                N=tk.PhotoImage(file="icons/knight_black.png"),
-                B=tk.PhotoImage(file="icons/bishop_black.png"),
-                Q=tk.PhotoImage(file="icons/queen_black.png"),
-                K=tk.PhotoImage(file="icons/king_black.png")
-            )
-        )
+        self.empty_image = _load_photo_image("icons/empty.png")
+        self.piece_images = _load_piece_images()
+
+        # one font shared by all the labels that use it, rather than a new Tk font per label
+        self.bold_font = tkinter.font.Font(family='Arial', size=12, weight=tkinter.font.BOLD)
 
         self.app = app
         self.view_and_status_frame = tk.Frame(self)
@@ -416,13 +539,13 @@ class ChessBoardGui(tk.Frame):
         self.claim_draw_handler = None
         self.clear_handlers()
         self.ui_tasks = collections.deque()
-        self.ui_thread_done = threading.Condition()
+        self.poll_idle_ms = 10  # how long to wait before looking for new UI tasks when there are none
         self._run_tkinter_tasks()
 
     def clear_handlers(self):
         self.set_offer_draw_handler = lambda _: None
-        self.surrender_handler = lambda _: None
-        self.claim_draw_handler = lambda _: None
+        self.surrender_handler = lambda: None
+        self.claim_draw_handler = lambda: None
 
     def _open_game_configuration(self):
         self._game_starts_buttons_frame = self.GameStartButtonsFrame(self, self)
@@ -453,13 +576,12 @@ class ChessBoardGui(tk.Frame):
         self.ui_tasks.append(task)
 
     def _run_tkinter_tasks(self):
-        while len(self.ui_tasks) > 0:
+        # Only the tasks queued so far are run, tasks queued in the meantime are left for the next round so that Tk
+        # gets to handle its own events in between. The next round comes right away if there are tasks waiting.
+        for _ in range(len(self.ui_tasks)):
             self.ui_tasks.popleft()()
 
-        with self.ui_thread_done:
-            self.ui_thread_done.notify()
-
-        self.after(1, self._run_tkinter_tasks)
+        self.after(0 if self.ui_tasks else self.poll_idle_ms, self._run_tkinter_tasks)
 
 
 class ChessApp(tk.Tk):
@@ -3,10 +3,14 @@ import sys
 import chess
 import ai
 import arbiter
-import time
 import threading
 
 
+# board coordinates denoted by the letters and digits of the move notation
+_X_BY_LETTER = dict((letter, x) for x, letter in enumerate("abcdefgh"))
+_Y_BY_DIGIT = dict((digit, y) for y, digit in enumerate("12345678"))
+
+
 class CLIHumanPlayer(arbiter.ChessPlayer):
 
     def __init__(self, cli):
@@ -14,6 +18,7 @@ class CLIHumanPlayer(arbiter.ChessPlayer):
 
     def on_turn_to_act(self, arbiter):
         self.cli.time_to_play.set()
+        self.cli.wake_up.set()
 
     def cancel_turn_to_act(self, arbiter):
         pass
@@ -21,7 +26,8 @@ class CLIHumanPlayer(arbiter.ChessPlayer):
 
 class CLIGameStateWatcher(arbiter.GameWatcher):
 
-    def __init__(self):
+    def __init__(self, cli):
+        self.cli = cli
         self.game_finished = threading.Event()
 
     def on_game_state_changed(self, arbiter):
@@ -31,8 +37,9 @@ class CLIGameStateWatcher(arbiter.GameWatcher):
         if result.is_finished:
             sys.stdout.write(result.outcome.describe() + " by " + result.ended_by_rule.describe(game_state) + "\n")
             self.game_finished.set()
+            self.cli.wake_up.set()
         else:
-            sys.stdout.write(dict(W="White", B="Black")[game_state.playing_team] + " moves.\n")
+            sys.stdout.write(chess.TEAM_NAMES[game_state.playing_team] + " moves.\n")
             if result.may_claim_draw:
                 sys.stdout.write("May claim draw by " + result.may_claim_draw_by_rule.describe(game_state) + "\n")
 
@@ -40,6 +47,7 @@ class CLIGameStateWatcher(arbiter.GameWatcher):
 class CommandLineInterface:
     def __init__(self):
         self.time_to_play = threading.Event()
+        self.wake_up = threading.Event()  # set whenever it is time to play or the game has finished
 
     def _parse_move_notation(self, playing_team, notation):
         """
@@ -49,13 +57,14 @@ class CommandLineInterface:
         :return: symbol of piece to move; predicate for from_pos, to_pos, piece to promote to
                  or None if notation is invalid.
         """
+        i = 0  # index of the next character to consume
+
         def consume(chars):
-            nonlocal notation
+            nonlocal i
 
-            if len(notation) > 0 and notation[0] in chars:
-                result = notation[0]
-                notation = notation[1:]
-                return result
+            if i < len(notation) and notation[i] in chars:
+                i += 1
+                return notation[i - 1]
             else:
                 return None
 
@@ -67,14 +76,11 @@ class CommandLineInterface:
 
         piece_symbol = consume(chess.piece_class_by_symbol) or "P"
 
-        letters = "abcdefgh"
-        digits = "12345678"
+        col_0 = consume(_X_BY_LETTER)
+        row_0 = consume(_Y_BY_DIGIT)
 
-        col_0 = consume(letters)
-        row_0 = consume(digits)
-
-        col_1 = consume(letters)
-        row_1 = consume(digits)
+        col_1 = consume(_X_BY_LETTER)
+        row_1 = consume(_Y_BY_DIGIT)
 
         if consume("="):
             promoted_to = consume(chess.piece_class_by_symbol)
@@ -88,26 +94,29 @@ class CommandLineInterface:
                 return None
             if not (col_0 and row_0):
                 return None
-            if len(notation) > 0:
+            if i != len(notation):
                 return None
-            to_pos = (letters.index(col_0), digits.index(row_0))
+            to_pos = (_X_BY_LETTER[col_0], _Y_BY_DIGIT[row_0])
             return piece_symbol, lambda _: True, to_pos, promoted_to
         if not row_1:
             return None
 
-        if len(notation) > 0:
+        if i != len(notation):
             return None
 
-        to_pos = (col_1 and letters.index(col_1), row_1 and digits.index(row_1))
+        to_pos = (_X_BY_LETTER[col_1], _Y_BY_DIGIT[row_1])
+        from_x = col_0 and _X_BY_LETTER[col_0]
+        from_y = row_0 and _Y_BY_DIGIT[row_0]
 
-        return piece_symbol, lambda from_pos: (not col_0 or from_pos[0] == letters.index(col_0)) and \
-                                              (not row_0 or from_pos[1] == digits.index(row_0)), to_pos, promoted_to
+        return piece_symbol, lambda from_pos: (not col_0 or from_pos[0] == from_x) and \
+                                              (not row_0 or from_pos[1] == from_y), to_pos, promoted_to
 
     def on_player_enter_turn(self, arbiter):
         offer_draw = False
+        legal_moves = arbiter.game_state.compute_legal_moves_for_playing_team()
 
         while True:
-            sys.stdout.write(dict(W="White", B="Black")[arbiter.game_state.playing_team] + "> ")
+            sys.stdout.write(chess.TEAM_NAMES[arbiter.game_state.playing_team] + "> ")
 
             move = next(sys.stdin).strip()
             if "claim draw" == move:
@@ -131,16 +140,14 @@ class CommandLineInterface:
                     symbol, from_pos_predicate, to_pos, promoted_to = move_notation
 
                     def is_matching_move(move):
-                        return all([
-                            move.moved_piece.symbol == symbol,
-                            from_pos_predicate(move.from_pos),
-                            move.to_pos == to_pos,
-                            promoted_to is None or isinstance(move, chess.PawnPromotionMove),
-                            not isinstance(move, chess.PawnPromotionMove) or \
-                            (promoted_to or "Q") == move.promoted_piece.symbol
-                        ])
+                        return move.moved_piece.symbol == symbol and \
+                            move.to_pos == to_pos and \
+                            from_pos_predicate(move.from_pos) and \
+                            (promoted_to is None or isinstance(move, chess.PawnPromotionMove)) and \
+                            (not isinstance(move, chess.PawnPromotionMove) or
+                             (promoted_to or "Q") == move.promoted_piece.symbol)
 
-                    moves = list(filter(is_matching_move, arbiter.game_state.compute_legal_moves_for_playing_team()))
+                    moves = [move for move in legal_moves if is_matching_move(move)]
 
                     if len(moves) == 0:
                         sys.stdout.write("Impossible move.\n")
@@ -186,18 +193,17 @@ class CommandLineInterface:
                              "surrender, offer draw, or claim draw when applicable.\n")
 
         a = arbiter.Arbiter(players)
-        watcher = CLIGameStateWatcher()
+        watcher = CLIGameStateWatcher(self)
         a.watchers.append(watcher)
         a.start_game()
 
-        while True:
+        while not watcher.game_finished.is_set():
+            self.wake_up.wait()
+            self.wake_up.clear()
+
             if self.time_to_play.is_set():
                 self.time_to_play.clear()
                 self.on_player_enter_turn(a)
-            elif not watcher.game_finished.is_set():
-                time.sleep(0.25)
-            else:
-                break
 
     def main(self):
 